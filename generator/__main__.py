@@ -30,13 +30,21 @@ def main():
     parser.add_argument("--debug", "-d", required=False, action="store_true", help="Turn on debug logs")
     parser.add_argument("--fail_on_error", "-e", required=False, action="store_true",
                         help="Raise exception on e.g. unsupported verb properties")
+    parser.add_argument("--throttling_rate_limit", required=False, type=float,
+                        help="Default stage throttling rate limit (requests per second). "
+                             "Per operation limits can be set with 'x-throttling: {rateLimit, burstLimit}'")
+    parser.add_argument("--throttling_burst_limit", required=False, type=int,
+                        help="Default stage throttling burst limit")
+    parser.add_argument("--usage_plan", required=False, action="store_true",
+                        help="Create a usage plan with an API key and require the key on all methods")
     args = parser.parse_args()
 
     if args.debug:
         logger.setLevel("DEBUG")
 
     generator = Generator(args.file, args.backend_url, args.proxy, args.vpc_link_id, args.apigateway_region,
-                          args.cors_origins, args.fail_on_error)
+                          args.cors_origins, args.fail_on_error, args.throttling_rate_limit,
+                          args.throttling_burst_limit, args.usage_plan)
     generator.generate()
 
 
@@ -32,18 +32,26 @@ CORS_MAPPING_ALLOWED_HEADERS = """\
 #end
 """
 
+THROTTLING_EXTENSION = "x-throttling"
+THROTTLING_KEYS = ["rateLimit", "burstLimit"]
+API_KEY_SECURITY_NAME = "api_key"
+
 logger = logging.getLogger(__name__)
 
 
 class Generator:
 
-    def __init__(self, openapi_path, backend_url, proxy, vpc_link_id, apigateway_region, cors_origins, fail_on_error):
+    def __init__(self, openapi_path, backend_url, proxy, vpc_link_id, apigateway_region, cors_origins, fail_on_error,
+                 throttling_rate_limit=None, throttling_burst_limit=None, usage_plan=False):
         self.openapi_path = openapi_path
         self.backend_url = backend_url
         self.proxy = proxy
         self.vpc_link_id = vpc_link_id
         self.apigateway_region = apigateway_region
         self.fail_on_error = fail_on_error
+        self.throttling_rate_limit = throttling_rate_limit
+        self.throttling_burst_limit = throttling_burst_limit
+        self.usage_plan = usage_plan
 
         self.output_folder = os.path.abspath(os.path.join(CURRENT_FOLDER, "out"))
         self.output_path_sam = os.path.join(self.output_folder, "apigateway.yaml")
@@ -52,7 +60,7 @@ class Generator:
             "corsOrigins": "{}".format(cors_origins)
         }
 
-        self.unsupported_keys = ["xml", "additionalProperties", "anyOffields", "example"]
+        self.unsupported_keys = ["xml", "additionalProperties", "anyOffields", "example", THROTTLING_EXTENSION]
 
         # Created by helper funcs during generate
         self.docs = None
@@ -62,14 +70,20 @@ class Generator:
         self.docs_type = None
         self.output_path_openapi = None
         self.cloudformation = None
+        self.method_settings = []
 
     def generate(self):
         # Don't dump reference pointers
         yaml.SafeDumper.ignore_aliases = lambda *args: True
 
-        self._create_empty_output_folder()
+        if self.throttling_rate_limit is not None or self.throttling_burst_limit is not None:
+            self._validate_throttling("stage", self.throttling_rate_limit, self.throttling_burst_limit)
+
         self._load_file()
         self._docs_version()
+        self._read_throttling()
+
+        self._create_empty_output_folder()
 
         self._determine_backend_type()
         self._create_backend_uri_start()
@@ -77,6 +91,7 @@ class Generator:
         self._init_sam_template()
 
         self._loop_paths()
+        self._add_throttling()
 
         self._add_security()
         self.extended_docs = self._remove_unsupported(self.extended_docs)
@@ -178,6 +193,131 @@ class Generator:
             }
         }
 
+    def _read_throttling(self):
+        self.method_settings = []
+        for p in self.docs["paths"]:
+            for v in self.docs["paths"][p]:
+                if isinstance(self.docs["paths"][p][v], dict):
+                    self._read_method_throttling(p, v)
+
+    def _read_method_throttling(self, p, v):
+        throttling = self.docs["paths"][p][v].get(THROTTLING_EXTENSION)
+        if throttling is None:
+            return
+
+        route = "{} {}".format(v.upper(), p)
+        if not isinstance(throttling, dict):
+            raise RuntimeError("Invalid '{}' for [{}], expected an object with {}: [{}]".format(
+                THROTTLING_EXTENSION, route, THROTTLING_KEYS, throttling))
+
+        unknown_keys = [k for k in throttling if k not in THROTTLING_KEYS]
+        if unknown_keys:
+            raise RuntimeError("Unsupported '{}' keys for [{}]: {}. Supported: {}".format(
+                THROTTLING_EXTENSION, route, unknown_keys, THROTTLING_KEYS))
+
+        rate_limit = throttling.get("rateLimit")
+        burst_limit = throttling.get("burstLimit")
+        self._validate_throttling(route, rate_limit, burst_limit)
+
+        # MethodSettings resource paths encode every '/' as '~1', e.g. /pet/{petId} -> /~1pet~1{petId},
+        # except the root resource which is a single '/'
+        if p == "/":
+            resource_path = "/"
+        else:
+            resource_path = "/" + p.replace("/", "~1")
+
+        method_setting = {
+            "ResourcePath": resource_path,
+            "HttpMethod": v.upper(),
+        }
+        if rate_limit is not None:
+            method_setting["ThrottlingRateLimit"] = rate_limit
+        if burst_limit is not None:
+            # CloudFormation only accepts integer burst limits, e.g. 20.0 -> 20
+            method_setting["ThrottlingBurstLimit"] = int(burst_limit)
+
+        logger.info("Adding throttling for route [%s]: rate [%s], burst [%s]", route, rate_limit, burst_limit)
+        self.method_settings.append(method_setting)
+
+    def _validate_throttling(self, route, rate_limit, burst_limit):
+        if rate_limit is None and burst_limit is None:
+            raise RuntimeError("Throttling for [{}] must set 'rateLimit' and/or 'burstLimit'".format(route))
+
+        for name, value in [("rateLimit", rate_limit), ("burstLimit", burst_limit)]:
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0):
+                raise RuntimeError("Invalid throttling '{}' for [{}]: [{}]".format(name, route, value))
+
+        if burst_limit is not None and not float(burst_limit).is_integer():
+            raise RuntimeError("Throttling 'burstLimit' for [{}] must be an integer: [{}]".format(route, burst_limit))
+
+        if self.throttling_rate_limit is not None and rate_limit is not None and rate_limit > self.throttling_rate_limit:
+            raise RuntimeError("Throttling 'rateLimit' [{}] for [{}] exceeds the stage rate limit [{}]".format(
+                rate_limit, route, self.throttling_rate_limit))
+
+        if self.throttling_burst_limit is not None and burst_limit is not None and \
+                burst_limit > self.throttling_burst_limit:
+            raise RuntimeError("Throttling 'burstLimit' [{}] for [{}] exceeds the stage burst limit [{}]".format(
+                burst_limit, route, self.throttling_burst_limit))
+
+    def _add_throttling(self):
+        api_properties = self.cloudformation["Resources"]["Api"]["Properties"]
+        stage_throttling = {}
+        if self.throttling_rate_limit is not None:
+            stage_throttling["ThrottlingRateLimit"] = self.throttling_rate_limit
+        if self.throttling_burst_limit is not None:
+            stage_throttling["ThrottlingBurstLimit"] = int(self.throttling_burst_limit)
+
+        if stage_throttling:
+            logger.info("Adding stage throttling: [%s]", stage_throttling)
+            stage_setting = {
+                "ResourcePath": "/*",
+                "HttpMethod": "*",
+            }
+            stage_setting.update(stage_throttling)
+            self.method_settings.insert(0, stage_setting)
+
+        if self.method_settings:
+            api_properties["MethodSettings"] = self.method_settings
+
+        if self.usage_plan:
+            self._add_usage_plan(stage_throttling)
+
+    def _add_usage_plan(self, stage_throttling):
+        # SAM 'Auth.UsagePlan' needs an inline DefinitionBody, so the resources are created explicitly
+        logger.info("Adding usage plan with API key")
+        usage_plan_properties = {
+            "Description": "Usage plan auto generated by openapi-aws-apigateway-generator",
+            "ApiStages": [
+                {
+                    "ApiId": {"Ref": "Api"},
+                    "Stage": {"Ref": "Api.Stage"},
+                }
+            ],
+        }
+        if stage_throttling:
+            usage_plan_properties["Throttle"] = {
+                k.replace("Throttling", ""): v for k, v in stage_throttling.items()
+            }
+
+        self.cloudformation["Resources"]["UsagePlan"] = {
+            "Type": "AWS::ApiGateway::UsagePlan",
+            "Properties": usage_plan_properties,
+        }
+        self.cloudformation["Resources"]["ApiKey"] = {
+            "Type": "AWS::ApiGateway::ApiKey",
+            "Properties": {
+                "Enabled": True,
+            },
+        }
+        self.cloudformation["Resources"]["UsagePlanKey"] = {
+            "Type": "AWS::ApiGateway::UsagePlanKey",
+            "Properties": {
+                "KeyId": {"Ref": "ApiKey"},
+                "KeyType": "API_KEY",
+                "UsagePlanId": {"Ref": "UsagePlan"},
+            },
+        }
+
     def _extend_verbs(self, p, v):
         verb_docs = self.docs["paths"][p][v]
         logger.debug("Extending verb for route [%s %s]", v, p)
@@ -255,6 +395,26 @@ class Generator:
         if "securityDefinitions" in self.docs:
             del self.extended_docs["securityDefinitions"]
 
+        if self.usage_plan:
+            self._add_api_key_security()
+
+    def _add_api_key_security(self):
+        api_key_scheme = {
+            "type": "apiKey",
+            "name": "x-api-key",
+            "in": "header",
+        }
+        if self.docs_type == "swagger":
+            self.extended_docs["securityDefinitions"] = {API_KEY_SECURITY_NAME: api_key_scheme}
+        else:
+            components = self.extended_docs.setdefault("components", {})
+            components.setdefault("securitySchemes", {})[API_KEY_SECURITY_NAME] = api_key_scheme
+
+        for p in self.docs["paths"]:
+            for v in self.docs["paths"][p]:
+                # Loop the original docs so the generated CORS 'options' methods stay without API key
+                self.extended_docs["paths"][p][v]["security"] = [{API_KEY_SECURITY_NAME: []}]
+
     def _remove_unsupported(self, current_dict):
         new_dict = copy.deepcopy(current_dict)
 
@@ -4,6 +4,8 @@ import os
 import shutil
 import unittest
 
+import yaml
+
 from generator.generator import Generator, CURRENT_FOLDER
 
 logger = logging.getLogger("generator.generator")
@@ -110,6 +112,267 @@ class TestGenerator(unittest.TestCase):
         self.assertIn("httpHost", self.generator.stage_variables)
         self.assertEqual("my-backend.com", self.generator.stage_variables["httpHost"])
 
+    def test_read_method_throttling(self):
+        self.generator.docs = {
+            "paths": {
+                "/pet/{petId}": {
+                    "get": {
+                        "x-throttling": {
+                            "rateLimit": 10,
+                            "burstLimit": 20
+                        }
+                    }
+                }
+            }
+        }
+        self.generator._read_method_throttling("/pet/{petId}", "get")
+        exp = [
+            {
+                "ResourcePath": "/~1pet~1{petId}",
+                "HttpMethod": "GET",
+                "ThrottlingRateLimit": 10,
+                "ThrottlingBurstLimit": 20
+            }
+        ]
+        self.assertEqual(exp, self.generator.method_settings)
+
+        self.generator.docs["paths"]["/pet/{petId}"]["get"]["x-throttling"]["burstLimit"] = 20.0
+        self.generator.method_settings = []
+        self.generator._read_method_throttling("/pet/{petId}", "get")
+        self.assertEqual(exp, self.generator.method_settings)
+        self.assertIsInstance(self.generator.method_settings[0]["ThrottlingBurstLimit"], int)
+
+    def test_read_method_throttling_root_path(self):
+        self.generator.docs = {
+            "paths": {
+                "/": {
+                    "get": {
+                        "x-throttling": {
+                            "rateLimit": 5
+                        }
+                    }
+                }
+            }
+        }
+        self.generator._read_method_throttling("/", "get")
+        exp = [
+            {
+                "ResourcePath": "/",
+                "HttpMethod": "GET",
+                "ThrottlingRateLimit": 5
+            }
+        ]
+        self.assertEqual(exp, self.generator.method_settings)
+
+    def test_read_method_throttling_not_dict_raises_runtime(self):
+        for invalid in [10, "10", [10]]:
+            self.generator.docs = {
+                "paths": {
+                    "/pet": {
+                        "get": {
+                            "x-throttling": invalid
+                        }
+                    }
+                }
+            }
+            self.assertRaises(RuntimeError, self.generator._read_method_throttling, "/pet", "get")
+
+    def test_read_method_throttling_empty_raises_runtime(self):
+        self.generator.docs = {
+            "paths": {
+                "/pet": {
+                    "get": {
+                        "x-throttling": {}
+                    }
+                }
+            }
+        }
+        self.assertRaises(RuntimeError, self.generator._read_method_throttling, "/pet", "get")
+
+    def test_read_method_throttling_unknown_key_raises_runtime(self):
+        self.generator.docs = {
+            "paths": {
+                "/pet": {
+                    "get": {
+                        "x-throttling": {
+                            "ratelimit": 10
+                        }
+                    }
+                }
+            }
+        }
+        self.assertRaises(RuntimeError, self.generator._read_method_throttling, "/pet", "get")
+
+    def test_generate_invalid_throttling_keeps_output_folder(self):
+        self.generator.openapi_path = os.path.join(self.current_folder, "throttling_swagger.yaml")
+        self.generator.throttling_rate_limit = 1
+        self.generator._create_empty_output_folder()
+        self.assertRaises(RuntimeError, self.generator.generate)
+        self.assertTrue(os.path.isdir(self.generator.output_folder))
+        self.assertEqual([], os.listdir(self.generator.output_folder))
+
+    def test_read_method_throttling_without_annotation(self):
+        self.generator.docs = {
+            "paths": {
+                "/pet": {
+                    "get": {}
+                }
+            }
+        }
+        self.generator._read_method_throttling("/pet", "get")
+        self.assertEqual([], self.generator.method_settings)
+
+    def test_validate_throttling_missing_limits_raises_runtime(self):
+        self.assertRaises(RuntimeError, self.generator._validate_throttling, "GET /pet", None, None)
+
+    def test_validate_throttling_invalid_value_raises_runtime(self):
+        self.assertRaises(RuntimeError, self.generator._validate_throttling, "GET /pet", "10", None)
+        self.assertRaises(RuntimeError, self.generator._validate_throttling, "GET /pet", -1, None)
+        self.assertRaises(RuntimeError, self.generator._validate_throttling, "GET /pet", None, 1.5)
+
+    def test_validate_throttling_exceeding_stage_rate_raises_runtime(self):
+        self.generator.throttling_rate_limit = 100
+        self.assertRaises(RuntimeError, self.generator._validate_throttling, "GET /pet", 101, None)
+
+    def test_validate_throttling_exceeding_stage_burst_raises_runtime(self):
+        self.generator.throttling_burst_limit = 50
+        self.assertRaises(RuntimeError, self.generator._validate_throttling, "GET /pet", 10, 51)
+
+    def test_validate_throttling_within_stage_limits(self):
+        self.generator.throttling_rate_limit = 100
+        self.generator.throttling_burst_limit = 50
+        self.generator._validate_throttling("GET /pet", 100, 50)
+
+    def test_add_throttling_stage_defaults(self):
+        self.generator.throttling_rate_limit = 100.0
+        self.generator.throttling_burst_limit = 50
+        self.generator._init_sam_template()
+        self.generator._add_throttling()
+        exp = [
+            {
+                "ResourcePath": "/*",
+                "HttpMethod": "*",
+                "ThrottlingRateLimit": 100.0,
+                "ThrottlingBurstLimit": 50
+            }
+        ]
+        self.assertEqual(exp, self.generator.cloudformation["Resources"]["Api"]["Properties"]["MethodSettings"])
+        self.assertNotIn("UsagePlan", self.generator.cloudformation["Resources"])
+
+    def test_add_throttling_without_limits(self):
+        self.generator._init_sam_template()
+        self.generator._add_throttling()
+        self.assertNotIn("MethodSettings", self.generator.cloudformation["Resources"]["Api"]["Properties"])
+
+    def test_add_throttling_usage_plan(self):
+        self.generator.throttling_rate_limit = 100.0
+        self.generator.usage_plan = True
+        self.generator._init_sam_template()
+        self.generator._add_throttling()
+        resources = self.generator.cloudformation["Resources"]
+        self.assertEqual({"RateLimit": 100.0}, resources["UsagePlan"]["Properties"]["Throttle"])
+        self.assertEqual("AWS::ApiGateway::ApiKey", resources["ApiKey"]["Type"])
+        self.assertEqual({"Ref": "UsagePlan"}, resources["UsagePlanKey"]["Properties"]["UsagePlanId"])
+
+    def test_add_api_key_security_swagger(self):
+        self.generator.docs_type = "swagger"
+        self.generator.docs = {
+            "paths": {
+                "/pet": {
+                    "get": {}
+                }
+            }
+        }
+        self.generator.extended_docs = {
+            "paths": {
+                "/pet": {
+                    "get": {},
+                    "options": {}
+                }
+            }
+        }
+        self.generator._add_api_key_security()
+        self.assertIn("api_key", self.generator.extended_docs["securityDefinitions"])
+        self.assertEqual([{"api_key": []}], self.generator.extended_docs["paths"]["/pet"]["get"]["security"])
+        self.assertNotIn("security", self.generator.extended_docs["paths"]["/pet"]["options"])
+
+    def test_add_api_key_security_openapi(self):
+        self.generator.docs_type = "openapi"
+        self.generator.docs = {
+            "paths": {
+                "/pet": {
+                    "get": {}
+                }
+            }
+        }
+        self.generator.extended_docs = {
+            "components": {
+                "schemas": {}
+            },
+            "paths": {
+                "/pet": {
+                    "get": {},
+                    "options": {}
+                }
+            }
+        }
+        self.generator._add_api_key_security()
+        self.assertIn("schemas", self.generator.extended_docs["components"])
+        self.assertIn("api_key", self.generator.extended_docs["components"]["securitySchemes"])
+        self.assertEqual([{"api_key": []}], self.generator.extended_docs["paths"]["/pet"]["get"]["security"])
+        self.assertNotIn("security", self.generator.extended_docs["paths"]["/pet"]["options"])
+
+    def _generate_throttling(self, file_name):
+        self.generator.openapi_path = os.path.join(self.current_folder, file_name)
+        self.generator.backend_url = "http://my-backend.com"
+        self.generator.throttling_rate_limit = 100.0
+        self.generator.throttling_burst_limit = 50
+        self.generator.usage_plan = True
+        self.generator.generate()
+
+        with open(self.generator.output_path_openapi) as f:
+            openapi = yaml.safe_load(f)
+        with open(self.generator.output_path_sam) as f:
+            sam = yaml.safe_load(f)
+
+        for p in openapi["paths"]:
+            self.assertNotIn("x-throttling", openapi["paths"][p]["get"])
+            self.assertEqual([{"api_key": []}], openapi["paths"][p]["get"]["security"])
+            self.assertNotIn("security", openapi["paths"][p]["options"])
+
+        exp_method_settings = [
+            {
+                "ResourcePath": "/*",
+                "HttpMethod": "*",
+                "ThrottlingRateLimit": 100.0,
+                "ThrottlingBurstLimit": 50
+            },
+            {
+                "ResourcePath": "/",
+                "HttpMethod": "GET",
+                "ThrottlingRateLimit": 5
+            },
+            {
+                "ResourcePath": "/~1pet~1{petId}",
+                "HttpMethod": "GET",
+                "ThrottlingRateLimit": 10,
+                "ThrottlingBurstLimit": 20
+            }
+        ]
+        self.assertEqual(exp_method_settings, sam["Resources"]["Api"]["Properties"]["MethodSettings"])
+        self.assertEqual({"RateLimit": 100.0, "BurstLimit": 50}, sam["Resources"]["UsagePlan"]["Properties"]["Throttle"])
+        self.assertEqual({"Type": "AWS::ApiGateway::ApiKey", "Properties": {"Enabled": True}}, sam["Resources"]["ApiKey"])
+        self.assertEqual("AWS::ApiGateway::UsagePlanKey", sam["Resources"]["UsagePlanKey"]["Type"])
+        return openapi
+
+    def test_generate_throttling_swagger(self):
+        openapi = self._generate_throttling("throttling_swagger.yaml")
+        self.assertIn("api_key", openapi["securityDefinitions"])
+
+    def test_generate_throttling_openapi(self):
+        openapi = self._generate_throttling("throttling_openapi.yaml")
+        self.assertIn("api_key", openapi["components"]["securitySchemes"])
+
     def tearDown(self):
         if os.path.isdir(self.generator.output_folder):
             shutil.rmtree(self.generator.output_folder)